@@ -16,6 +16,7 @@
 # with this program; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
+import copy
 import re
 
 from twisted.python import reflect
@@ -33,6 +34,8 @@ attribute_set = log.Event("Attribute {attr} set in {brick} with value "
                           "{value}.")
 param_not_found = log.Event("Parameter {param} in {brick} not found. "
                             "(val: {value})")
+_IMMUTABLE_TYPES = frozenset([type(None), bool, int, long, float, str,
+                              unicode])
 
 
 class Config(dict):
@@ -69,6 +72,20 @@ class Config(dict):
             raise AttributeError(name)
         return self.parameters[name].to_string(self[name])
 
+    def __deepcopy__(self, memo):
+        # Configurations are mostly made of strings and numbers, copy them
+        # directly and leave the generic machinery to the few mutable values.
+        cls = self.__class__
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+        new.__dict__.update(self.__dict__)
+        immutable = _IMMUTABLE_TYPES
+        deepcopy = copy.deepcopy
+        dict.update(new, ((name, value if type(value) in immutable
+                           else deepcopy(value, memo))
+                          for name, value in self.iteritems()))
+        return new
+
     def dump(self, write):
         for key in sorted(self.iterkeys()):
             write("%s=%s" % (key, self[key]))
@@ -214,14 +231,19 @@ class Base(object):
         return False
 
     def set(self, attrs):
+        # Notify the observers only once and only if something changed
+        changed = False
+        config = self.config
         for name, value in attrs.iteritems():
-            if value != self.config[name]:
+            if value != config[name]:
                 logger.info(attribute_set, attr=name, brick=self, value=value)
-                self.config[name] = value
+                config[name] = value
+                changed = True
                 setter = getattr(self, "cbset_" + name, None)
                 if setter:
                     setter(value)
-        self.notify_changed()
+        if changed:
+            self.notify_changed()
 
     def get(self, name):
         try:
@@ -58,6 +58,9 @@ new_event_ok = log.Event("New event {name} OK")
 uncaught_exception = log.Event("Uncaught exception: {error()}")
 brick_stop = log.Event("Error on brick poweroff")
 
+NAME_START_RE = re.compile(r"\A[a-zA-Z]")
+NAME_RE = re.compile(r"\A[a-zA-Z0-9_.-]+\Z")
+
 
 def install_brick_types(registry=None):
     if registry is None:
@@ -88,6 +91,50 @@ def install_brick_types(registry=None):
     return registry
 
 
+class NameIndex(object):
+    """Index the objects of a list by one of their attributes.
+
+    The index follows the list incrementally, it is meant to be used only
+    while the list can only grow and the indexed attribute does not change,
+    as during the restore of a project. Like a linear scan, the first object
+    with a given name is returned.
+    """
+
+    def __init__(self, objects, attr="name"):
+        self.objects = objects
+        self.attr = attr
+        self.index = {}
+        self.synced = 0
+
+    def get(self, name):
+        objects = self.objects
+        if len(objects) < self.synced:
+            # Some object has been removed, start again
+            self.index.clear()
+            self.synced = 0
+        if len(objects) > self.synced:
+            index = self.index
+            attr = self.attr
+            for obj in self._new_objects():
+                index.setdefault(getattr(obj, attr), obj)
+            self.synced = len(objects)
+        return self.index.get(name)
+
+    def _new_objects(self):
+        objects = self.objects
+        if hasattr(objects, "get_iter"):
+            # A tree model, like the socks of the gui (gui.List), cannot be
+            # sliced and islice would fetch again every row already indexed:
+            # start from the first new row instead.
+            itr = objects.get_iter(self.synced)
+            while itr:
+                yield objects.get_value(itr, 0)
+                itr = objects.iter_next(itr)
+        else:
+            for obj in itertools.islice(objects, self.synced, None):
+                yield obj
+
+
 class BrickFactory(object):
     """This is the main class for the core engine.
 
@@ -98,6 +145,9 @@ class BrickFactory(object):
     # __restore is True during the restore of the project. Events are not
     # propagated.
     __restore = False
+    # indexes by name of bricks, events, disk images and socks, and of disk
+    # images by path, only during the restore of the project
+    __indexes = None
     __signals = ("brick-added", "brick-removed", "brick-changed",
                  "image-added", "image-removed", "image-changed",
                  "event-added", "event-removed", "event-changed",
@@ -166,7 +216,13 @@ class BrickFactory(object):
 
     def set_restore(self, restore):
         # self.__restore = restore
-        pass
+        if restore:
+            self.__indexes = (NameIndex(self.bricks), NameIndex(self.events),
+                              NameIndex(self.disk_images),
+                              NameIndex(self.socks, "nickname"),
+                              NameIndex(self.disk_images, "path"))
+        else:
+            self.__indexes = None
 
     # Disk Images
 
@@ -183,6 +239,10 @@ class BrickFactory(object):
         return img
 
     def assert_path_not_in_use(self, path):
+        if self.__indexes is not None:
+            if self.__indexes[4].get(path) is not None:
+                raise errors.ImageAlreadyInUseError(path)
+            return
         for img in self.disk_images:
             if img.path == path:
                 raise errors.ImageAlreadyInUseError(path)
@@ -194,6 +254,8 @@ class BrickFactory(object):
     def get_image_by_name(self, name):
         """Return a disk image given its name or {None}."""
 
+        if self.__indexes is not None:
+            return self.__indexes[2].get(name)
         for img in self.disk_images:
             if img.name == name:
                 return img
@@ -201,6 +263,8 @@ class BrickFactory(object):
     def get_image_by_path(self, path):
         """Get disk image object from the image library by its path."""
 
+        if self.__indexes is not None:
+            return self.__indexes[4].get(path)
         for img in self.disk_images:
             if img.path == path:
                 return img
@@ -268,6 +332,8 @@ class BrickFactory(object):
         self._notify("brick-removed", brick)
 
     def get_brick_by_name(self, name):
+        if self.__indexes is not None:
+            return self.__indexes[0].get(name)
         for b in self.bricks:
             if b.name == name:
                 return b
@@ -309,6 +375,8 @@ class BrickFactory(object):
         self._notify("event-removed", event)
 
     def get_event_by_name(self, name):
+        if self.__indexes is not None:
+            return self.__indexes[1].get(name)
         for e in self.events:
             if e.name == name:
                 return e
@@ -329,6 +397,9 @@ class BrickFactory(object):
         """used to determine whether the chosen name can be used or
         it has already a duplicate among bricks or events."""
 
+        if self.__indexes is not None:
+            return any(index.get(name) is not None
+                       for index in self.__indexes[:3])
         for o in itertools.chain(self.bricks, self.events, self.disk_images):
             if o.name == name:
                 return True
@@ -346,11 +417,11 @@ class BrickFactory(object):
         if not isinstance(name, str):
             raise errors.InvalidNameError(_("Name must be a string"))
         _name = name.strip()
-        if not re.search("\A[a-zA-Z]", _name):
+        if not NAME_START_RE.match(_name):
             msg = _("Name {0} does not start with a " "letter").format(name)
             raise errors.InvalidNameError(msg)
-        _name = re.sub(' ', '_', _name)
-        if not re.search("\A[a-zA-Z0-9_\.-]+\Z", _name):
+        _name = _name.replace(" ", "_")
+        if not NAME_RE.match(_name):
             msg = _("Name must contains only letters, numbers, underscores, "
                     "hyphens and points, {}").format(name)
             raise errors.InvalidNameError(msg)
@@ -369,6 +440,8 @@ class BrickFactory(object):
     def get_sock_by_name(self, name):
         if name == "_hostonly":
             return virtualmachines.hostonly_sock
+        if self.__indexes is not None:
+            return self.__indexes[3].get(name)
         for sock in self.socks:
             if sock.nickname == name:
                 return sock
@@ -45,12 +45,16 @@ process_done = log.Event("Process terminated")
 event_unavailable = log.Event("Warning. The Event {name} attached to Brick "
                               "{brick} is not available. Skipping execution.")
 shutdown_brick = log.Event("Shutting down {name} (pid: {pid})")
+kill_error = log.Event("Cannot kill {name} (pid: {pid})")
 start_brick = log.Event("Starting: {args()}")
 open_console = log.Event("Opening console for {name}\n%{args()}\n")
 console_done = log.Event("Console terminated\n{status}")
 console_terminated = log.Event("Console terminated\n{status}\nProcess stdout:"
                                "\n{out()}\nProcess stderr:\n{err()}\n")
 invalid_ack = log.Event("ACK received but no command sent.")
+process_output = log.Event("{data()}")
+vde_ack = log.Event("{ack}")
+vde_command = log.Event("{cmd}")
 
 
 class ProcessLogger(object):
@@ -90,10 +94,13 @@ class Process(protocol.ProcessProtocol):
         self.brick.process_ended(self, status)
 
     def outReceived(self, data):
-        self.logger.info(data)
+        self.logger.info(process_output,
+                         data=lambda: data.decode("utf-8", "replace"))
 
     def errReceived(self, data):
-        self.logger.error(data, hide_to_user=True)
+        self.logger.error(process_output,
+                          data=lambda: data.decode("utf-8", "replace"),
+                          hide_to_user=True)
 
     # new interface
 
@@ -154,7 +161,7 @@ class VDEProcessProtocol(Process):
             self.ack_received(ack)
 
     def ack_received(self, ack):
-        self.logger.info(ack)
+        self.logger.info(vde_ack, ack=ack)
         try:
             self.queue.popleft()
         except IndexError:
@@ -171,7 +178,7 @@ class VDEProcessProtocol(Process):
 
     def _send_command(self):
         cmd = self.queue[0]
-        self.logger.info(cmd)
+        self.logger.info(vde_command, cmd=cmd)
         if cmd.endswith(self.delimiter):
             return self.transport.write(cmd)
         return self.transport.writeSequence((cmd, self.delimiter))
@@ -218,11 +225,15 @@ class Config(_Config):
 class Brick(base.Base):
 
     proc = None
-    command_builder = {}
+    # A sequence of (switch, value) pairs, see build_cmd_line
+    command_builder = ()
     term_command = "vdeterm"
     _started_d = None
     _exited_d = None
     _last_status = None
+    _kill_call = None
+    _paths = None
+    terminate_timeout = 5
     process_protocol = VDEProcessProtocol
     config_factory = Config
 
@@ -283,8 +294,19 @@ class Brick(base.Base):
             return defer.fail(e)
         except error.ProcessExitedAlready:
             pass
+        else:
+            # if the process ignores SIGTERM, kill it after a while
+            if not kill and self._kill_call is None:
+                self._kill_call = reactor.callLater(self.terminate_timeout,
+                                                    self._kill)
         return self._exited_d
 
+    def _kill(self):
+        self._kill_call = None
+        d = self.poweroff(kill=True)
+        d.addErrback(logger.failure_eb, kill_error, name=self.name,
+                     pid=self.pid)
+
     def get_parameters(self):
         raise NotImplementedError("Bricks.get_parameters() not implemented")
 
@@ -307,6 +329,9 @@ class Brick(base.Base):
 
     def process_ended(self, proc, status):
         self.proc = None
+        if self._kill_call is not None:
+            self._kill_call.cancel()
+            self._kill_call = None
         self._start_related_events(off=True)
         self._last_status = status
         # ovvensive programming, raise an exception instead of hide the error
@@ -336,35 +361,34 @@ class Brick(base.Base):
     def build_cmd_line(self):
         # TODO: documents the behavior of all cases (#, *, etc.)
         res = []
-
-        for switch, value in self.command_builder.items():
-            if not switch.startswith("#"):
-                if callable(value):
-                    value = value()
-                else:
-                    value = self.config.get(value)
-                if value is "*":
+        get = self.config.get
+        for switch, value in self.command_builder:
+            first = switch[:1]
+            if first == "#":
+                continue
+            value = value() if callable(value) else get(value)
+            if value == "*":
+                res.append(switch)
+            elif value:
+                if first != "*":
                     res.append(switch)
-                elif value is not None and len(value) > 0:
-                    if not switch.startswith("*"):
-                        res.append(switch)
-                    res.append(value)
+                res.append(value)
         return res
 
     def _poweron(self, ignore):
 
-        def start_process(value):
-            prog, args = value
+        def start_process(args):
+            # args() already resolves the executable, don't look it up twice
+            prog = args[0]
             logger.info(start_brick, args=lambda: " ".join(args))
             # usePTY?
             if self.needsudo():
                 prog = settings.get("sudo")
-                args = [settings.get("sudo"), "--"] + args
+                args = [prog, "--"] + args
             self.proc = self.process_protocol(self)
             reactor.spawnProcess(self.proc, prog, args, os.environ)
 
-        l = [defer.maybeDeferred(self.prog), defer.maybeDeferred(self.args)]
-        d = defer.gatherResults(l, consumeErrors=True)
+        d = defer.maybeDeferred(self.args)
         d.addCallback(start_process)
         return d
 
@@ -386,11 +410,21 @@ class Brick(base.Base):
     # Console related operations.
     #############################
 
+    def _get_paths(self):
+        # Cache the paths, they are rebuilt only when the brick is renamed or
+        # the project home changes (e.g. the project is renamed)
+        key = (settings.VIRTUALBRICKS_HOME, self.name)
+        if self._paths is None or self._paths[0] != key:
+            home, name = key
+            self._paths = (key, "%s/%s.ctl" % (home, name),
+                           "%s/%s.mgmt" % (home, name))
+        return self._paths
+
     def path(self):
-        return "%s/%s.ctl" % (settings.VIRTUALBRICKS_HOME, self.name)
+        return self._get_paths()[1]
 
     def console(self):
-        return "%s/%s.mgmt" % (settings.VIRTUALBRICKS_HOME, self.name)
+        return self._get_paths()[2]
 
     def connect(self, endpoint, *args):
         for p in self.plugs:
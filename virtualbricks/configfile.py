@@ -21,6 +21,7 @@ import os.path
 import errno
 import traceback
 import contextlib
+import cStringIO
 
 from twisted.python import filepath
 from zope.interface import implementer
@@ -73,10 +74,26 @@ log_events = [link_type_error,
               config_save_error]
 
 
+# Projects are read and written in a few large chunks
+BUFFER_SIZE = 1 << 20
+
+
+def link_or_copy(original, fbackup):
+    # The project is saved to a new file that replaces the original one, a
+    # hard link is enough to keep the old content and it does not copy it
+    try:
+        os.link(original.path, fbackup.path)
+    except OSError as e:
+        if e.errno == errno.ENOENT:
+            raise
+        # stale backup or hard links are not supported
+        original.copyTo(fbackup)
+
+
 @contextlib.contextmanager
 def backup(original, fbackup):
     try:
-        original.copyTo(fbackup)
+        link_or_copy(original, fbackup)
     except OSError as e:
         if e.errno == errno.ENOENT:
             yield
@@ -86,6 +103,9 @@ def backup(original, fbackup):
 
 
 def restore_backup(filename, fbackup):
+    # Usually there is no backup, don't move the project back and forth
+    if not fbackup.exists():
+        return
     filename_back = filename.sibling(filename.basename() + ".back")
     created = False
     try:
@@ -154,11 +174,13 @@ class LinkBuilder:
             logger.warn(brick_not_found, brick=link.owner, line="|".join(link))
 
 
+link_builders = {"sock": SockBuilder, "link": LinkBuilder}
+
+
 def link_builder_factory(context):
-    if context.type == "sock":
-        return SockBuilder()
-    elif context.type == "link":
-        return LinkBuilder()
+    builder = link_builders.get(context.type)
+    if builder is not None:
+        return builder()
 
 
 interfaces.registerAdapter(link_builder_factory, configparser.Link,
@@ -215,13 +237,14 @@ class SectionConsumer:
             pass
 
 
+section_builders = {"Image": ImageBuilder, "Event": EventBuilder}
+
+
 def brick_builder_factory(context):
-    if context.type == "Image":
-        return ImageBuilder(context.name)
-    elif context.type == "Event":
-        return EventBuilder(context.name)
-    else:
-        return BrickBuilder(context.type, context.name)
+    builder = section_builders.get(context.type)
+    if builder is not None:
+        return builder(context.name)
+    return BrickBuilder(context.type, context.name)
 
 
 class CompatibleBuilder:
@@ -277,15 +300,18 @@ class CompatibleSwitchWrapperBuilder(CompatibleBuilder):
         return
 
 
+compatible_builders = {"Qemu": CompatibleVMBuilder,
+                       "SwitchWrapper": CompatibleSwitchWrapperBuilder}
+
+
 def compatible_brick_builder_factory(context):
     if context.type == "Project":
         return SectionConsumer()
     elif context.type == "DiskImage":
         context.type = "Image"
-    elif context.type == "Qemu":
-        return CompatibleVMBuilder(context.name)
-    elif context.type == "SwitchWrapper":
-        return CompatibleSwitchWrapperBuilder(context.name)
+    builder = compatible_builders.get(context.type)
+    if builder is not None:
+        return builder(context.name)
     return brick_builder_factory(context)
 
 
@@ -312,8 +338,12 @@ class ConfigFile:
             logger.debug(config_dump, path=fp.path)
             with backup(fp, fp.sibling(fp.basename() + "~")):
                 tmpfile = fp.sibling("." + fp.basename() + ".sav")
-                with tmpfile.open("w") as fd:
-                    self.save_to(factory, fd)
+                # Every object writes its own lines, collect them in memory
+                # and write the project at once
+                buf = cStringIO.StringIO()
+                self.save_to(factory, buf)
+                with open(tmpfile.path, "wb", BUFFER_SIZE) as fd:
+                    fd.write(buf.getvalue())
                 tmpfile.moveTo(fp)
         else:
             self.save_to(factory, str_or_obj)
@@ -333,9 +363,10 @@ class ConfigFile:
                 socks.extend(brick.socks)
             plugs.extend(brick.plugs)
 
-        for sock in socks:
-            t = "sock|{s.brick.name}|{s.nickname}|{s.model}|{s.mac}\n"
-            fileobj.write(t.format(s=sock))
+        fileobj.writelines(["sock|%s|%s|%s|%s\n" % (sock.brick.name,
+                                                    sock.nickname, sock.model,
+                                                    sock.mac)
+                            for sock in socks])
 
         for plug in plugs:
             plug.save_to(fileobj)
@@ -348,14 +379,17 @@ class ConfigFile:
                 fp = str_or_obj
             restore_backup(fp, fp.sibling(fp.basename() + "~"))
             logger.info(open_project, path=fp.path)
-            with fp.open() as fd:
+            with open(fp.path, "rb", BUFFER_SIZE) as fd:
                 self.restore_from(factory, fd)
         else:
             self.restore_from(factory, str_or_obj)
 
     def restore_from(self, factory, fileobj):
+        # The parser reads a line and asks for the position at every line,
+        # read the whole project once and parse it from memory
+        buf = cStringIO.StringIO(fileobj.read())
         with freeze_notify(factory):
-            for item in configparser.Parser(fileobj):
+            for item in configparser.Parser(buf):
                 interfaces.IBuilder(item).load_from(factory, item)
 
 
@@ -17,15 +17,53 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
 import re
+import string
 import collections
 
 __metaclass__ = type
 
+WORD_CHARS = string.ascii_letters + string.digits + "_"
 
-class Section:
 
-    EMPTY = re.compile(r"^\s*$")
-    CONFIG_LINE = re.compile(r"^(\w+)\s*=\s*(.*)$")
+def is_word(s):
+    """Return C{True} if C{s} is not empty and made only of C{WORD_CHARS}.
+
+    Unlike str.isalnum() the result does not depend on the locale.
+    """
+
+    return bool(s) and not s.strip(WORD_CHARS)
+
+
+def parse_config_line(line):
+    """Split a C{name = value} line in its name and its value.
+
+    Return C{None} if the line is not a configuration line. The name must be
+    a word at the start of the line, spaces around C{=} are ignored.
+    """
+
+    name, sep, value = line.partition("=")
+    name = name.rstrip()
+    if sep and is_word(name):
+        return name, value.lstrip().rstrip("\n")
+    return None
+
+
+def parse_section_header(line):
+    """Split a C{[type:name]} line in its type and its name.
+
+    Return C{None} if the line is not a section header.
+    """
+
+    if line.endswith("\n"):
+        line = line[:-1]
+    if line.startswith("[") and line.endswith("]"):
+        type, sep, name = line[1:-1].partition(":")
+        if sep and name and is_word(type):
+            return type, name
+    return None
+
+
+class Section:
 
     def __init__(self, type, name, fileobj):
         self.type = type
@@ -33,25 +71,16 @@ class Section:
         self.fileobj = fileobj
 
     def __iter__(self):
-        curpos = self.fileobj.tell()
-        line = self.fileobj.readline()
-        while line:
-            if line.startswith("#") or self.EMPTY.match(line):
-                curpos = self.fileobj.tell()
-                line = self.fileobj.readline()
+        fileobj = self.fileobj
+        for line in iter(fileobj.readline, ""):
+            if line.startswith("#") or not line.strip():
                 continue
-            match = self.CONFIG_LINE.match(line)
-            if match:
-                name, value = match.groups()
-                if value is None:
-                    # value is None when the parameter is not set
-                    value = ""
-                yield name, value
-                curpos = self.fileobj.tell()
-                line = self.fileobj.readline()
-            else:
-                self.fileobj.seek(curpos)
+            option = parse_config_line(line)
+            if option is None:
+                # The section is over, give the line back to the parser
+                fileobj.seek(fileobj.tell() - len(line))
                 return
+            yield option
 
 
 Link = collections.namedtuple("Link", ["type", "owner", "sockname", "model",
@@ -60,8 +89,7 @@ Link = collections.namedtuple("Link", ["type", "owner", "sockname", "model",
 
 class Parser:
 
-    EMPTY = re.compile(r"^\s*$")
-    SECTION_HEADER = re.compile(r"^\[([a-zA-Z0-9_]+):(.+)\]$")
+    LINK_TYPES = ("link|", "sock|")
     LINK = re.compile(r"^(?P<type>link|sock)\|"
                       "(?P<owner>[a-zA-Z][\w.-]*)\|"
                       "(?P<sockname>[a-zA-Z_][\w.-]*)\|"
@@ -77,16 +105,21 @@ class Parser:
         second kind of section.
         """
 
-        line = self.fileobj.readline()
+        fileobj = self.fileobj
+        readline = fileobj.readline
+        match_link = self.LINK.match
+        link_types = self.LINK_TYPES
+        line = readline()
         while line:
-            if line.startswith("#") or self.EMPTY.match(line):
-                line = self.fileobj.readline()
+            if line.startswith("#") or not line.strip():
+                line = readline()
                 continue
-            match = self.SECTION_HEADER.match(line)
-            if match:
-                yield Section(match.group(1), match.group(2), self.fileobj)
-            else:
-                match = self.LINK.match(line)
+            if line.startswith("["):
+                header = parse_section_header(line)
+                if header:
+                    yield Section(header[0], header[1], fileobj)
+            elif line.startswith(link_types):
+                match = match_link(line)
                 if match:
                     yield Link._make(match.groups())
-            line = self.fileobj.readline()
+            line = readline()
@@ -90,7 +90,7 @@ import textwrap
 import pango
 import gtk
 import twisted
-from twisted.internet import utils, defer, task, error
+from twisted.internet import utils, defer, task, error, threads
 from twisted.python import filepath
 if twisted.__version__ >= '15.0.2':
     # This is an ugly hack but virtualbricks is not really ready for
@@ -151,24 +151,52 @@ brick_invalid_name = log.Event("Cannot create brick: Invalid name.")
 created = log.Event("Created successfully")
 apply_settings = log.Event("Apply settings...")
 
-NUMERIC = set(map(str, range(10)))
-NUMPAD = set(map(lambda i: "KP_%d" % i, range(10)))
-EXTRA = set(["BackSpace", "Delete", "Left", "Right", "Home", "End", "Tab"])
-VALIDKEY = NUMERIC | NUMPAD | EXTRA
-
-BUG_REPORT_ERRORS = {
-    1: "Error in command line syntax.",
-    2: "One of the files passed on the command line did not exist.",
-    3: "A required tool could not be found.",
-    4: "The action failed.",
-    5: "No permission to read one of the files passed on the command line."
-}
+NUMERIC = tuple(str(i) for i in range(10))
+NUMPAD = tuple("KP_%d" % i for i in range(10))
+EXTRA = ("BackSpace", "Delete", "Left", "Right", "Home", "End", "Tab")
+# keyvals instead of names, key press events can be checked without calling
+# gtk.gdk.keyval_name for every keystroke
+VALIDKEY = frozenset(gtk.gdk.keyval_from_name(name)
+                     for name in NUMERIC + NUMPAD + EXTRA)
+RETURN = gtk.gdk.keyval_from_name("Return")
+
+# the log is saved CHUNK_SIZE characters at a time through a BUFFER_SIZE buffer
+CHUNK_SIZE = 1 << 16
+BUFFER_SIZE = 1 << 20
+
+# xdg-email error messages, indexed by exit code
+BUG_REPORT_ERRORS = (
+    None,
+    "Error in command line syntax.",
+    "One of the files passed on the command line did not exist.",
+    "A required tool could not be found.",
+    "The action failed.",
+    "No permission to read one of the files passed on the command line."
+)
 
 BODY = """-- DO NOT MODIFY THE FOLLOWING LINES --
 
  affects virtualbrick
 """
 
+_xdg_email_env = None
+
+
+def get_xdg_email_env():
+    """Return the environment of xdg-email, built once."""
+
+    global _xdg_email_env
+    if _xdg_email_env is None:
+        _xdg_email_env = dict(os.environ, MM_NOTTTY="1")
+    return _xdg_email_env
+
+
+def write_tempfile(chunks):
+    fd, filename = tempfile.mkstemp()
+    with os.fdopen(fd, "w", BUFFER_SIZE) as fp:
+        fp.writelines(chunks)
+    return filename
+
 
 def destroy_on_exit(func):
     @functools.wraps(func)
@@ -197,15 +225,47 @@ class Base(object):
     domain = "virtualbricks"
     resource = None
     name = None
+    _builder = None
+    _widget = None
 
     def __init__(self):
-        self.builder = builder = gtk.Builder()
+        pass
+
+    def _build(self):
+        """Build the widgets tree.
+
+        This is done the first time the builder or one of the widgets is
+        accessed. Dialogs that keep their constructor free of widgets and
+        configure them in _post_build() are built only when shown."""
+
+        builder = gtk.Builder()
         builder.set_translation_domain(self.domain)
         builder.add_from_file(graphics.get_data_filename(self.resource))
-        self.widget = builder.get_object(self._get_name())
+        widget = builder.get_object(self._get_name())
+        # set only once the tree is complete, a failed build is retried
+        self._builder, self._widget = builder, widget
         builder.connect_signals(self)
+        self._post_build()
+
+    def _post_build(self):
+        """Called once the widgets tree is built."""
+
+    @property
+    def builder(self):
+        if self._builder is None:
+            self._build()
+        return self._builder
+
+    @property
+    def widget(self):
+        if self._builder is None:
+            self._build()
+        return self._widget
 
     def __getattr__(self, name):
+        if name.startswith("_"):
+            # private attributes are never widgets, do not build the tree
+            raise AttributeError(name)
         obj = self.builder.get_object(name)
         if obj is None:
             raise AttributeError(name)
@@ -269,6 +329,7 @@ class LoggingWindow(Window):
         Window.__init__(self)
         self.textbuffer = textbuffer
         self.__bottom = True
+        self.__chooser = None
         textview = self.get_object("textview")
         textview.set_buffer(textbuffer)
         self.__insert_text_h = textbuffer.connect("changed",
@@ -290,6 +351,9 @@ class LoggingWindow(Window):
 
     def on_LoggingWindow_destroy(self, window):
         self.textbuffer.disconnect(self.__insert_text_h)
+        if self.__chooser is not None:
+            self.__chooser.destroy()
+            self.__chooser = None
 
     def on_closebutton_clicked(self, button):
         self.window.destroy()
@@ -298,36 +362,62 @@ class LoggingWindow(Window):
         self.textbuffer.set_text("")
 
     def on_savebutton_clicked(self, button):
-        chooser = gtk.FileChooserDialog(title=_("Save as..."),
+        # the file chooser is slow to build, it is created once and reused
+        if self.__chooser is None:
+            self.__chooser = chooser = gtk.FileChooserDialog(
+                title=_("Save as..."),
                 action=gtk.FILE_CHOOSER_ACTION_SAVE,
                 buttons=(gtk.STOCK_CANCEL, gtk.RESPONSE_CANCEL,
                         gtk.STOCK_SAVE, gtk.RESPONSE_OK))
-        chooser.set_do_overwrite_confirmation(True)
-        chooser.connect("response", self.__on_dialog_response)
-        chooser.show()
+            chooser.set_transient_for(self.window)
+            chooser.set_do_overwrite_confirmation(True)
+            chooser.connect("response", self.__on_dialog_response)
+            chooser.connect("delete-event", lambda d, e: d.hide_on_delete())
+        self.__chooser.show()
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """Yield the content of the buffer in chunks of chunk_size
+        characters, the whole log is never copied in a single string."""
+
+        start = self.textbuffer.get_start_iter()
+        while not start.is_end():
+            end = start.copy()
+            end.forward_chars(chunk_size)
+            yield self.textbuffer.get_text(start, end, False)
+            start = end
+
+    def save_to(self, fp):
+        for chunk in self.iter_chunks():
+            fp.write(chunk)
 
     def __on_dialog_response(self, dialog, response_id):
         try:
             if response_id == gtk.RESPONSE_OK:
-                with open(dialog.get_filename(), "w") as fp:
-                    fp.write(self.textbuffer.get_property("text"))
+                with open(dialog.get_filename(), "w", BUFFER_SIZE) as fp:
+                    self.save_to(fp)
         finally:
-            dialog.destroy()
+            dialog.hide()
 
     def on_reportbugbutton_clicked(self, button):
         logger.info(bug_send)
-        fd, filename = tempfile.mkstemp()
-        os.write(fd, self.textbuffer.get_property("text"))
         gtk.link_button_set_uri_hook(None)
-        exit_d = utils.getProcessOutputAndValue("xdg-email",
-            ["--utf8", "--body", BODY, "--attach", filename,
-             "new@bugs.launchpad.net"],
-            dict(os.environ, MM_NOTTTY="1"))
+
+        def send_report(filename):
+            return utils.getProcessOutputAndValue("xdg-email",
+                ["--utf8", "--body", BODY, "--attach", filename,
+                 "new@bugs.launchpad.net"],
+                get_xdg_email_env())
+
+        # the text buffer must be read in the main thread, the file is
+        # written in a thread so that the interface is not blocked
+        exit_d = threads.deferToThread(write_tempfile,
+                                       list(self.iter_chunks()))
+        exit_d.addCallback(send_report)
 
         def success((out, err, code)):
             if code == 0:
                 logger.info(bug_sent)
-            elif code in BUG_REPORT_ERRORS:
+            elif 0 < code < len(BUG_REPORT_ERRORS):
                 logger.error(bug_error, err=BUG_REPORT_ERRORS[code],
                              stderr=err, hide_to_user=True)
             else:
@@ -336,7 +426,6 @@ class LoggingWindow(Window):
 
         exit_d.addCallback(success)
         exit_d.addErrback(logger.failure_eb, bug_err_unknown)
-        exit_d.addBoth(lambda _: os.close(fd))
 
 
 class DisksLibraryDialog(Window):
@@ -431,12 +520,10 @@ class UsbDevWindow(Window):
     @staticmethod
     def parse_lsusb(output):
         for line in output.splitlines():
-            info = line.split(" ID ")[1]
-            if " " in info:
-                code, descr = info.split(" ", 1)
-            else:
-                code, descr = info, ""
-            yield virtualmachines.UsbDevice(code, descr)
+            info = line.partition(" ID ")[2]
+            if info:
+                code, sep, descr = info.partition(" ")
+                yield virtualmachines.UsbDevice(code, descr)
 
     @classmethod
     def show_dialog(cls, gui, usb_devices):
@@ -464,27 +551,46 @@ class BaseEthernetDialog(Window):
 
     resource = "ethernetdialog.ui"
     name = "EthernetDialog"
+    # network card model -> row. Every ethernet dialog loads the same
+    # ethernetdialog.ui, whose netmodel_model rows are fixed, so the index is
+    # the same for all the instances and is built only once.
+    _netmodel_index = None
 
     def __init__(self, factory, brick):
         Window.__init__(self)
         self.factory = factory
         self.brick = brick
 
+    def get_netmodel_index(self):
+        if BaseEthernetDialog._netmodel_index is None:
+            index = {}
+            for i, (model, ) in enumerate(iter_model(
+                    self.get_object("netmodel_model"), 0)):
+                index.setdefault(model, i)
+            BaseEthernetDialog._netmodel_index = index
+        return BaseEthernetDialog._netmodel_index
+
     def is_valid(self, mac):
         return tools.mac_is_valid(mac)
 
-    def setup(self):
+    def setup(self, selected=None):
+        """Fill the socks model and return the row of the selected sock, if
+        any, so that the caller does not have to search for it."""
+
         socks = self.get_object("sock_model")
-        socks.append(("Host-only ad hoc network",
-                      virtualmachines.hostonly_sock))
+        rows = [("Host-only ad hoc network", virtualmachines.hostonly_sock)]
         if settings.femaleplugs:
-            socks.append(("Vde socket", "_sock"))
-            for sock in self.factory.socks:
-                socks.append((sock.nickname, sock))
+            rows.append(("Vde socket", "_sock"))
+            rows.extend((sock.nickname, sock) for sock in self.factory.socks)
         else:
-            for sock in self.factory.socks:
-                if sock.brick.get_type().startswith("Switch"):
-                    socks.append((sock.nickname, sock))
+            rows.extend((sock.nickname, sock) for sock in self.factory.socks
+                        if sock.brick.get_type().startswith("Switch"))
+        selected_itr = None
+        for row in rows:
+            itr = socks.append(row)
+            if selected_itr is None and row[1] is selected:
+                selected_itr = itr
+        return selected_itr
 
     def on_randomize_button_clicked(self, button):
         self.get_object("mac_entry").set_text(tools.random_mac())
@@ -529,29 +635,19 @@ class EditEthernetDialog(BaseEthernetDialog):
         self.plug = plug
 
     def show(self, parent=None):
-        self.setup()
+        sock_itr = self.setup(self.plug.sock)
         self.get_object("title_label").set_label(
             "<b>Edit ethernet interface</b>")
         self.get_object("ok_button").set_property("label", gtk.STOCK_OK)
         self.get_object("mac_entry").set_text(self.plug.mac)
-        model = self.get_object("netmodel_model")
-        itr = model.get_iter_first()
-        while itr:
-            if model.get_value(itr, 0) == self.plug.model:
-                self.get_object("model_combo").set_active_iter(itr)
-                break
-            itr = model.iter_next(itr)
+        row = self.get_netmodel_index().get(self.plug.model)
+        if row is not None:
+            self.get_object("model_combo").set_active(row)
 
-        socks = self.get_object("sock_model")
         if self.plug.mode == "sock" and settings.femaleplugs:
             self.get_object("sock_combo").set_active(1)
-        else:
-            itr = socks.get_iter_first()
-            while itr:
-                if self.plug.sock is socks.get_value(itr, 1):
-                    self.get_object("sock_combo").set_active_iter(itr)
-                    break
-                itr = socks.iter_next(itr)
+        elif sock_itr is not None:
+            self.get_object("sock_combo").set_active_iter(sock_itr)
         BaseEthernetDialog.show(self, parent)
 
     def do(self, sock, mac, model):
@@ -574,14 +670,22 @@ class ConfirmDialog(Window):
     def __init__(self, question, on_yes=None, on_yes_arg=None, on_no=None,
                  on_no_arg=None, ):
         Window.__init__(self)
-        self.window.set_markup(question)
+        self.question = question
+        self.secondary_text = None
         self.on_yes = on_yes
         self.on_yes_arg = on_yes_arg
         self.on_no = on_no
         self.on_no_arg = on_no_arg
 
+    def _post_build(self):
+        self._widget.set_markup(self.question)
+        if self.secondary_text is not None:
+            self._widget.format_secondary_text(self.secondary_text)
+
     def format_secondary_text(self, text):
-        self.window.format_secondary_text(text)
+        self.secondary_text = text
+        if self._builder is not None:
+            self.window.format_secondary_text(text)
 
     def on_ConfirmDialog_response(self, dialog, response_id):
         if response_id == gtk.RESPONSE_YES and self.on_yes:
@@ -600,14 +704,14 @@ class NewEventDialog(Window):
         self.gui = gui
 
     def on_delay_entry_key_press_event(self, entry, event):
-        if gtk.gdk.keyval_name(event.keyval) not in VALIDKEY:
-            return True
-        elif gtk.gdk.keyval_name(event.keyval) == "Return":
+        if event.keyval == RETURN:
             self.window.response(gtk.RESPONSE_OK)
             return True
+        elif event.keyval not in VALIDKEY:
+            return True
 
     def on_name_entry_key_press_event(self, entry, event):
-        if gtk.gdk.keyval_name(event.keyval) == "Return":
+        if event.keyval == RETURN:
             self.window.response(gtk.RESPONSE_OK)
             return True
 
@@ -649,46 +753,40 @@ class BrickSelectionDialog(Window):
         Window.__init__(self)
         self._event = event
         self._action = action
-        self._added = set()
-        self.lBricks.set_data_source(bricks)
-        self.tmfAvl.set_visible_func(self._is_not_added, self._added)
-        self.tmfAdd.set_visible_func(self._is_added, self._added)
+        self.lAvailables.set_data_source(bricks)
         self.crName1.set_property("formatter", string.Formatter())
         self.crName2.set_property("formatter", string.Formatter())
         widgets.set_cells_data_func(self.tvcAvailables)
         widgets.set_cells_data_func(self.tvcAdded)
-        self.tmfAvl.refilter()
-        self.tmfAdd.refilter()
 
     @staticmethod
-    def _is_not_added(model, itr, added):
-        brick = model.get_value(itr, 0)
-        return brick and brick not in added
+    def _move_selected(treeview, dest):
+        """Move the selected rows of treeview at the end of dest.
 
-    @staticmethod
-    def _is_added(model, itr, added):
-        brick = model.get_value(itr, 0)
-        return brick and brick in added
+        Only the moved rows are touched, the other rows of the two lists are
+        not filtered or redrawn again."""
+
+        model, paths = treeview.get_selection().get_selected_rows()
+        rows = [gtk.TreeRowReference(model, path) for path in paths]
+        for row in rows:
+            itr = model.get_iter(row.get_path())
+            dest.append((model.get_value(itr, 0), ))
+            model.remove(itr)
 
     def on_add(self, *_):
-        for brick in self.tvAvailables.get_selected_values():
-            self._added.add(brick)
-        self.tvAvailables.get_model().refilter()
-        self.tvAdded.get_model().refilter()
+        self._move_selected(self.tvAvailables, self.lAdded)
         return True
 
     def on_remove(self, *_):
-        for brick in self.tvAdded.get_selected_values():
-            self._added.remove(brick)
-        self.tvAvailables.get_model().refilter()
-        self.tvAdded.get_model().refilter()
+        self._move_selected(self.tvAdded, self.lAvailables)
         return True
 
     @destroy_on_exit
     def on_BrickSelectionDialog_response(self, dialog, response_id):
         if response_id == gtk.RESPONSE_OK:
             act = self._action
-            actions = ("{0} {1}".format(b.name, act) for b in self._added)
+            actions = ("{0} {1}".format(row[0].name, act)
+                       for row in self.lAdded)
             self._event.set({"actions": map(console.VbShellCommand, actions)})
             logger.info(event_created)
 
@@ -727,7 +825,8 @@ class EventControllerMixin(object):
     def configure_event(self, event, attrs):
         model = self.get_object("actions_liststore")
         f = (console.VbShellCommand, console.ShellCommand)
-        attrs["actions"] = [f[row[1]](row[0]) for row in model if row[0]]
+        attrs["actions"] = [f[is_shell](text) for text, is_shell
+                            in iter_model(model, 0, 1) if text]
         event.set(attrs)
 
 
@@ -1402,15 +1501,20 @@ def _set_path(column, cell_renderer, model, iter, colid):
     cell_renderer.set_property("text",  path.path if path else "")
 
 
+# the placeholder style is created once, not for every cell drawn
+PLACEHOLDER_FONT = pango.FontDescription()
+PLACEHOLDER_FONT.set_style(pango.STYLE_ITALIC)
+PLACEHOLDER_COLOR = gtk.gdk.color_parse("gray")
+
+
 def _set_path_remap(column, cell_renderer, model, iter, colid):
     path = model.get_value(iter, colid)
     if path:
         cell_renderer.set_properties(font_desc=None, foreground=None,
                                      text=path.path)
     else:
-        font = pango.FontDescription()
-        font.set_style(pango.STYLE_ITALIC)
-        cell_renderer.set_properties(font_desc=font, foreground="gray",
+        cell_renderer.set_properties(font_desc=PLACEHOLDER_FONT,
+                                     foreground_gdk=PLACEHOLDER_COLOR,
                                      text="(Click here to select an image)")
 
 
@@ -1864,11 +1968,14 @@ class RenameDialog(Window):
     def __init__(self, original, checker=None):
         Window.__init__(self)
         self.original = original
+        self.checker = checker
+
+    def _post_build(self):
         entry = self.get_entry()
-        entry.set_text(original.name)
-        if checker:
+        entry.set_text(self.original.name)
+        if self.checker:
             self.set_sensitive(False)
-            entry.connect("changed", self.on_changed, checker)
+            entry.connect("changed", self.on_changed, self.checker)
 
     def get_entry(self):
         return self.get_object("name_entry")
@@ -36,6 +36,8 @@ __all__ = ["get_filename", "get_data", "get_image", "pixbuf_for_brick",
            "pixbuf_for_running_brick", "pixbuf_for_running_brick_at_size",
            "Node", "Topology", "get_data_filename"]
 
+WHITESPACE_RE = re.compile(r"\s+")
+
 
 def get_data_filename(resource):
     syswide = os.path.join(sys.prefix, "share", "virtualbricks", resource)
@@ -75,10 +77,19 @@ def saturate_if_stopped(brick, pixbuf):
     return pixbuf
 
 
+# (filename, width, height, running) -> pixbuf, the cell renderers ask for the
+# same icons at every redraw
+_pixbuf_cache = {}
+
+
 def pixbuf_for_brick_at_size(brick, width, height):
     filename = brick_icon(brick)
-    pixbuf = gtk.gdk.pixbuf_new_from_file_at_size(filename, width, height)
-    return saturate_if_stopped(brick, pixbuf)
+    key = (filename, width, height, is_running(brick))
+    pixbuf = _pixbuf_cache.get(key)
+    if pixbuf is None:
+        pixbuf = gtk.gdk.pixbuf_new_from_file_at_size(filename, width, height)
+        pixbuf = _pixbuf_cache[key] = saturate_if_stopped(brick, pixbuf)
+    return pixbuf
 
 
 def pixbuf_for_brick(brick):
@@ -175,7 +186,7 @@ class Topology:
         img = Image.open(self.get_image_filename())
         x_siz, y_siz = img.size
         for line in open(self.get_plain_filename()).readlines():
-            arg = re.split('\s+', line.rstrip('\n'))
+            arg = WHITESPACE_RE.split(line.rstrip('\n'))
             if arg[0] == 'graph':
                 if float(arg[2]) != 0 and float(arg[3]) != 0:
                     x_fact = scale * (x_siz / float(arg[2]))
@@ -83,6 +83,7 @@ BRICK_TARGET_NAME = "brick-connect-target"
 BRICK_DRAG_TARGETS = [
     (BRICK_TARGET_NAME, gtk.TARGET_SAME_WIDGET | gtk.TARGET_SAME_APP, 0)
 ]
+DELETE_KEYS = frozenset(map(gtk.gdk.keyval_from_name, ("Delete", "BackSpace")))
 
 
 @implementer(IMenu)
@@ -472,7 +473,7 @@ class EventConfigController(ConfigController, dialogs.EventControllerMixin):
         self.configure_event(self.original, attributes)
 
     def on_delay_entry_key_press_event(self, entry, event):
-        if gtk.gdk.keyval_name(event.keyval) not in dialogs.VALIDKEY:
+        if event.keyval not in dialogs.VALIDKEY:
             return True
 
     def on_action_treeview_key_press_event(self, treeview, event):
@@ -1875,13 +1876,13 @@ class VBGUI(TopologyMixin, ReadmeMixin, _Root):
         dialog.show()
 
     def on_bricks_treeview_key_release_event(self, treeview, event):
-        if gtk.gdk.keyval_name(event.keyval) in set(["Delete", "BackSpace"]):
+        if event.keyval in DELETE_KEYS:
             brick = treeview.get_selected_value()
             if brick is not None:
                 self.ask_remove_brick(brick)
 
     def on_events_treeview_key_release_event(self, treeview, event):
-        if gtk.gdk.keyval_name(event.keyval) in set(["Delete", "BackSpace"]):
+        if event.keyval in DELETE_KEYS:
             event = treeview.get_selected_value()
             if event is not None:
                 self.ask_remove_event(event)
@@ -2202,12 +2203,17 @@ class VisualFactory(brickfactory.BrickFactory):
         self.socks = List()
 
 
+# the oldest lines of the log are discarded past this limit
+LOG_MAX_LINES = 10000
+
+
 @implementer(log.ILogObserver)
 class TextBufferObserver:
 
-    def __init__(self, textbuffer):
+    def __init__(self, textbuffer, max_lines=LOG_MAX_LINES):
         textbuffer.create_mark("end", textbuffer.get_end_iter(), False)
         self.textbuffer = textbuffer
+        self.max_lines = max_lines
 
     def __call__(self, event):
         gobject.idle_add(self.emit, event)
@@ -2224,6 +2230,14 @@ class TextBufferObserver:
         iter = self.textbuffer.get_iter_at_mark(mark)
         self.textbuffer.insert_with_tags_by_name(iter, msg,
                                                  event["log_level"].name)
+        self.trim()
+
+    def trim(self):
+        textbuffer = self.textbuffer
+        exceeding = textbuffer.get_line_count() - self.max_lines
+        if exceeding > 0:
+            textbuffer.delete(textbuffer.get_start_iter(),
+                              textbuffer.get_iter_at_line(exceeding))
 
 
 class MessageDialogObserver:
@@ -15,6 +15,8 @@
 # with this program; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
+import string
+
 from zope.interface import implementer
 import gobject
 import gtk
@@ -105,7 +107,10 @@ class CellRendererFormattable(gtk.CellRendererText):
     def set_cell_data(cell_layout, cell, model, itr, data=None):
         obj = model.get_value(itr, 0)
         if cell._formatting_enabled:
-            if cell._formatter is not None:
+            if type(cell._formatter) is string.Formatter:
+                # same result, but the format string is parsed in C
+                text = cell._format_string.format(obj)
+            elif cell._formatter is not None:
                 text = cell._formatter.format(cell._format_string, obj)
             else:
                 text = format(obj, cell._format_string)
@@ -311,26 +316,28 @@ class TreeView(gtk.TreeView):
         else:
             model = self.get_model()
             selection.unselect_all()
+            # walk the model only once, whatever the number of values
+            values = list(iterable)
+            try:
+                values = set(values)
+            except TypeError:
+                pass
+            if not values:
+                return
             try:
                 mbr = model.get_property("value-member")
                 if not mbr:
                     raise TypeError
             except TypeError:
-                for value in iterable:
-                    itr = model.get_iter_first()
-                    while itr:
-                        obj = model.get_value(itr, 0)
-                        if obj == value:
-                            selection.select_iter(itr)
-                        itr = model.iter_next(itr)
-            else:
-                for value in iterable:
-                    itr = model.get_iter_first()
-                    while itr:
-                        obj = model.get_value(itr, 0)
-                        if getattr(obj, mbr) == value:
-                            selection.select_iter(itr)
-                        itr = model.iter_next(itr)
+                mbr = None
+            itr = model.get_iter_first()
+            while itr:
+                obj = model.get_value(itr, 0)
+                if mbr is not None:
+                    obj = getattr(obj, mbr)
+                if obj in values:
+                    selection.select_iter(itr)
+                itr = model.iter_next(itr)
 
     def set_cells_data_func(self):
         for column in self.get_columns():
@@ -88,9 +88,9 @@ class Plug:
         self.sock = None
 
     def save_to(self, fileobj):
-        tmp = "link|{0.brick.name}|{1}|{0.model}|{0.mac}\n"
-        fileobj.write(tmp.format(self,
-            self.sock.nickname if self.configured() else ""))
+        sockname = self.sock.nickname if self.configured() else ""
+        fileobj.write("link|%s|%s|%s|%s\n" % (self.brick.name, sockname,
+                                              self.model, self.mac))
 
 
 class Sock:
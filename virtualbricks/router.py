@@ -30,7 +30,7 @@ class Router(bricks.Brick):
     def __init__(self, factory, name):
         bricks.Brick.__init__(self, factory, name)
         self.config["name"] = name
-        self.command_builder = {"-M": self.console, "-c": "configfile"}
+        self.command_builder = (("-M", self.console), ("-c", "configfile"))
 
     def get_parameters(self):
         return "Work in progress..."
@@ -53,18 +53,18 @@ class Switch(bricks.Brick):
 
     def __init__(self, factory, name):
         bricks.Brick.__init__(self, factory, name)
-        self.command_builder = {"-x": "hub",
-                                # "-x": "hubmode",
-                                "-n": "numports",
-                                "-F": "fstp",
-                                "--macaddr": "macaddr",
-                                "-m": "mode",
-                                "-g": "group",
-                                "--priority": "priority",
-                                "--mgmtmode": "mgmtmode",
-                                "--mgmtgroup": "mgmtgroup",
-                                "-s": self.path,
-                                "-M": self.console}
+        self.command_builder = (("-M", self.console),
+                                ("-x", "hub"),
+                                # ("-x", "hubmode"),
+                                ("-n", "numports"),
+                                ("-F", "fstp"),
+                                ("--macaddr", "macaddr"),
+                                ("-m", "mode"),
+                                ("-g", "group"),
+                                ("--priority", "priority"),
+                                ("--mgmtmode", "mgmtmode"),
+                                ("--mgmtgroup", "mgmtgroup"),
+                                ("-s", self.path))
         sock = factory.new_sock(self, self.name + "_port")
         sock.path = self.path()
         self.socks.append(sock)
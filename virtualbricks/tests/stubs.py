@@ -54,7 +54,7 @@ class BrickStubConfig(bricks.Config):
 class BrickStub(BrickStubMixin, bricks.Brick):
 
     type = "Stub"
-    command_builder = {"-a": "a", "# -b": "b", "-c": "c", "-d": hook}
+    command_builder = (("-a", "a"), ("# -b", "b"), ("-c", "c"), ("-d", hook))
     config_factory = BrickStubConfig
 
     def __init__(self, factory, name):
@@ -88,7 +88,7 @@ FactoryStub = Factory
 class StubBrick(bricks.Brick):
 
     type = "Stub2"
-    command_builder = {"-a": "a", "# -b": "b", "-c": "c", "-d": hook}
+    command_builder = (("-a", "a"), ("# -b", "b"), ("-c", "c"), ("-d", hook))
     config_factory = BrickStubConfig
 
     def poweron(self):
@@ -116,6 +116,16 @@ class TestConfig(unittest.TestCase):
         self.assertIsNot(cfg, self.config2)
         self.assertIsNot(cfg["obj"], self.config2["obj"])
 
+    def test_deepcopy_mutable_values(self):
+        """Mutable values are not shared with the copy."""
+
+        self.config2["obj"] = [["a"]]
+        cfg = copy.deepcopy(self.config2)
+        self.assertIsInstance(cfg, Config2)
+        self.assertEqual(cfg["obj"], [["a"]])
+        self.assertIsNot(cfg["obj"][0], self.config2["obj"][0])
+        self.assertRaises(ValueError, cfg.__setitem__, "str2", "b")
+
     def test_copy(self):
         cfg = copy.copy(self.config2)
         self._assert_basic_types_equals(cfg, self.config2)
@@ -192,6 +202,16 @@ class TestBase(unittest.TestCase):
         sio.seek(0, os.SEEK_END)
         self.assertEqual(cur, sio.tell())
 
+    def test_set_notify_once(self):
+        """set() notifies observers once and only if a value changed."""
+
+        notified = []
+        self.brick.changed.connect(notified.append)
+        self.brick.set({"str": "b", "int": 43, "spinint": 31})
+        self.assertEqual(notified, [self.brick])
+        self.brick.set({"str": "b", "int": 43})
+        self.assertEqual(notified, [self.brick])
+
 #     def test_restore_advanced(self):
 #         sio = StringIO.StringIO(DUMP2)
 #         itr = iter(configfile.Parser(sio))
@@ -20,11 +20,11 @@ import errno
 import signal
 
 from twisted.trial import unittest
-from twisted.internet import error, defer
+from twisted.internet import error, defer, task
 from twisted.test import proto_helpers
 
-from virtualbricks import errors, link, bricks
-from virtualbricks.tests import stubs, successResultOf
+from virtualbricks import errors, link, bricks, settings, log
+from virtualbricks.tests import stubs, successResultOf, LoggingObserver
 
 
 def kill(passthru, brick):
@@ -48,6 +48,17 @@ class SleepBrick(stubs.BrickStub):
         return True
 
 
+class SignalRecorder:
+
+    pid = -1
+
+    def __init__(self):
+        self.signals = []
+
+    def signal_process(self, signo):
+        self.signals.append(signo)
+
+
 class TestBricks(unittest.TestCase):
 
     def setUp(self):
@@ -102,6 +113,22 @@ class TestBricks(unittest.TestCase):
         self.brick.poweron().addErrback(result.append)
         result[0].trap(IOError)
 
+    def test_poweron_prog_from_args(self):
+        """The executable spawned is the first element of args()."""
+
+        spawned = []
+
+        def spawnProcess(proto, prog, args, env):
+            spawned.append((prog, args))
+
+        from twisted.internet import reactor
+        self.patch(reactor, "spawnProcess", spawnProcess)
+        self.brick.configured = lambda: True
+        self.brick.prog = lambda: self.fail("prog() called twice")
+        self.brick.args = lambda: ["true", "-a"]
+        self.brick.poweron()
+        self.assertEqual(spawned, [("true", ["true", "-a"])])
+
     def test_poweroff_not_running(self):
         """
         If the brick is not started, poweroff succeed and return the last
@@ -165,6 +192,85 @@ class TestBricks(unittest.TestCase):
         d.addCallback(continue_test).addBoth(kill, self.brick)
         return d
 
+    def test_poweroff_kill_after_timeout(self):
+        """
+        If the process does not terminate after a SIGTERM, it is killed when
+        the timeout expires.
+        """
+
+        clock = task.Clock()
+        self.patch(bricks, "reactor", clock)
+        self.brick.proc = proc = SignalRecorder()
+        self.brick._exited_d = defer.Deferred()
+        self.brick.poweroff()
+        self.assertEqual(proc.signals, ["TERM"])
+        clock.advance(self.brick.terminate_timeout)
+        self.assertEqual(proc.signals, ["TERM", "KILL"])
+
+    def test_poweroff_kill_fails(self):
+        """
+        If the process cannot be killed when the timeout expires, the error is
+        logged.
+        """
+
+        def signal_process(signo):
+            proc.signals.append(signo)
+            if signo == "KILL":
+                raise OSError(errno.EPERM, os.strerror(errno.EPERM))
+
+        observer = LoggingObserver()
+        self.addCleanup(bricks.kill_error.tap(observer,
+                                              bricks.logger.publisher))
+        clock = task.Clock()
+        self.patch(bricks, "reactor", clock)
+        self.brick.proc = proc = SignalRecorder()
+        proc.signal_process = signal_process
+        self.brick._exited_d = defer.Deferred()
+        self.brick.poweroff()
+        clock.advance(self.brick.terminate_timeout)
+        self.assertEqual(proc.signals, ["TERM", "KILL"])
+        self.assertEqual(len(observer), 1)
+        self.assertEqual(observer[0]["log_failure"].value.errno, errno.EPERM)
+        self.assertEqual(len(self.flushLoggedErrors(OSError)), 1)
+
+    def test_process_ended_cancel_kill(self):
+        """
+        If the process terminates before the timeout, the kill is cancelled.
+        """
+
+        clock = task.Clock()
+        self.patch(bricks, "reactor", clock)
+        self.brick.proc = proc = SignalRecorder()
+        self.brick._exited_d = defer.Deferred()
+        self.brick.poweroff()
+        self.brick.process_ended(proc, None)
+        self.assertEqual(clock.getDelayedCalls(), [])
+        self.assertEqual(proc.signals, ["TERM"])
+
+    def test_paths_follow_rename(self):
+        """The cached control and console paths follow the brick's name."""
+
+        self.assertEqual(self.brick.console(),
+                         os.path.join(settings.VIRTUALBRICKS_HOME,
+                                      "test.mgmt"))
+        self.brick.set_name("renamed")
+        self.assertEqual(self.brick.path(),
+                         os.path.join(settings.VIRTUALBRICKS_HOME,
+                                      "renamed.ctl"))
+        self.assertEqual(self.brick.console(),
+                         os.path.join(settings.VIRTUALBRICKS_HOME,
+                                      "renamed.mgmt"))
+
+    def test_paths_follow_home(self):
+        """The cached paths follow the project home, e.g. after a rename."""
+
+        self.assertEqual(self.brick.path(),
+                         os.path.join(settings.VIRTUALBRICKS_HOME,
+                                      "test.ctl"))
+        self.patch(settings, "VIRTUALBRICKS_HOME", "/newhome")
+        self.assertEqual(self.brick.path(), "/newhome/test.ctl")
+        self.assertEqual(self.brick.console(), "/newhome/test.mgmt")
+
     def test_signal_process(self):
         pass
 
@@ -209,3 +315,13 @@ class TestVDEProcessProtocol(unittest.TestCase):
         self.assertEqual(len(self.proto.queue), 0)
         self.proto.data_received(self.PROMPT)
         self.assertTrue(self.transport.disconnecting)
+
+    def test_log_output(self):
+        """The output of the child is logged verbatim, braces included."""
+
+        observer = LoggingObserver()
+        self.addCleanup(bricks.process_output.tap(observer,
+                                                  bricks.logger.publisher))
+        bricks.Process.outReceived(self.proto, "{0} \xc3\xa8\n")
+        self.assertEqual(len(observer), 1)
+        self.assertEqual(log.formatEvent(observer[0]), u"{0} \xe8\n")
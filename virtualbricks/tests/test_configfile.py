@@ -43,6 +43,18 @@ link|sender|sw1_port|rtl8139|00:aa:79:71:be:61
 """
 
 
+class UnsliceableList(list):
+    """A list that, like the tree model used by the gui, cannot be sliced."""
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            raise TypeError("Invalid key %r" % (key, ))
+        return list.__getitem__(self, key)
+
+    def __getslice__(self, i, j):
+        raise TypeError("Invalid slice")
+
+
 class TestConfigFile(unittest.TestCase):
 
     def add_observer(self):
@@ -83,26 +95,29 @@ class TestConfigFile(unittest.TestCase):
              configfile.open_project, configfile.config_save_error])
 
     def test_restore_backup_does_not_exists(self):
-        """Try to restore a backup that does not exists."""
+        """
+        Try to restore a backup that does not exists. The project is not
+        touched and nothing is logged.
+        """
 
         observer = self.add_observer()
         config, backup = self.create_config_backup()
+        config.setContent("project")
         configfile.restore_backup(config, backup)
-        self.assertEqual(len(observer.msgs), 1)
-        self.assertFalse(observer.msgs[0]["isError"])
+        self.assertEqual(len(observer.msgs), 0)
         self.assertFalse(config.sibling(config.basename() + ".back").exists())
-        self.assertTrue(config.exists())
+        self.assertEqual(config.getContent(), "project")
 
     def test_restore_backup(self):
         """Restore a backup."""
 
         # observer = self.add_observer()
         config, backup = self.create_config_backup()
-        backup.touch()
+        backup.setContent("backup")
         configfile.restore_backup(config, backup)
         self.assertFalse(config.sibling(config.basename() + ".back").exists())
         self.assertFalse(backup.exists())
-        self.assertTrue(config.exists())
+        self.assertEqual(config.getContent(), "backup")
 
     def test_backup_context(self):
         filename = self.mktemp()
@@ -116,6 +131,17 @@ class TestConfigFile(unittest.TestCase):
             self.assertTrue(original.getContent(), fbackup.getContent())
         self.assertFalse(fbackup.exists())
 
+    def test_backup_context_stale_backup(self):
+        """A stale backup is replaced with the current project."""
+
+        original = filepath.FilePath(self.mktemp())
+        original.setContent("new")
+        fbackup = original.sibling(original.basename() + "~")
+        fbackup.setContent("old")
+        with configfile.backup(original, fbackup):
+            self.assertEqual(fbackup.getContent(), "new")
+        self.assertFalse(fbackup.exists())
+
     def test_save(self):
         """Save a project."""
 
@@ -126,6 +152,17 @@ class TestConfigFile(unittest.TestCase):
         config.save(factory, fp)
         self.assertEqual(fp.getContent(), "[Switch:sw]\n\n")
 
+    def test_save_sock(self):
+        """The socks of a virtual machine are saved after the bricks."""
+
+        factory = stubs.FactoryStub()
+        vm = factory.new_brick("vm", "vm")
+        vm.add_sock("00:11:22:33:44:55", "e1000")
+        sio = StringIO.StringIO()
+        configfile.ConfigFile().save_to(factory, sio)
+        self.assertTrue(sio.getvalue().endswith(
+            "\nsock|vm|vm_sock_eth0|e1000|00:11:22:33:44:55\n"))
+
     def test_restore(self):
         """Restore a project."""
 
@@ -136,6 +173,19 @@ class TestConfigFile(unittest.TestCase):
         config.restore(factory, fp)
         self.assertIsNotNone(factory.get_brick_by_name("sender"))
 
+    def test_restore_links_unsliceable_socks(self):
+        """Links are restored even if the socks cannot be sliced."""
+
+        factory = stubs.Factory()
+        factory.socks = UnsliceableList()
+        fp = filepath.FilePath(self.mktemp())
+        fp.setContent(CONFIG1)
+        configfile.ConfigFile().restore(factory, fp)
+        sender = factory.get_brick_by_name("sender")
+        self.assertEqual(len(sender.plugs), 1)
+        self.assertIs(sender.plugs[0].sock,
+                      factory.get_sock_by_name("sw1_port"))
+
     def _add_observer(self, event=None):
         observer = LoggingObserver()
         if event:
@@ -270,6 +320,42 @@ class TestParser(unittest.TestCase):
         expected = tuple(line[:-1].split("|"))
         self.assertEqual(list(parser), [expected])
 
+    def test_parse_config_line(self):
+        """Spaces around the equal sign are ignored, the value is kept."""
+
+        parse = configparser.parse_config_line
+        self.assertEqual(parse("name=value\n"), ("name", "value"))
+        self.assertEqual(parse("my_name = a = b \n"), ("my_name", "a = b "))
+        self.assertEqual(parse("name=\n"), ("name", ""))
+        self.assertEqual(parse("name="), ("name", ""))
+        self.assertIs(parse("[Switch:sw1]\n"), None)
+        self.assertIs(parse(" name=value\n"), None)
+        self.assertIs(parse("my name=value\n"), None)
+        self.assertIs(parse("=value\n"), None)
+
+    def test_parse_section_header(self):
+        """The type is a word, the name is everything up to the bracket."""
+
+        parse = configparser.parse_section_header
+        self.assertEqual(parse("[Switch:sw1]\n"), ("Switch", "sw1"))
+        self.assertEqual(parse("[Qemu:vm:1]"), ("Qemu", "vm:1"))
+        self.assertIs(parse("[Switch:]\n"), None)
+        self.assertIs(parse("[:sw1]\n"), None)
+        self.assertIs(parse("[Switch sw1]\n"), None)
+        self.assertIs(parse("[Swi-tch:sw1]\n"), None)
+        self.assertIs(parse("[Switch:sw1] \n"), None)
+        self.assertIs(parse("[Sw\xe8:sw1]\n"), None)
+
+    def test_section_stops_at_next_section(self):
+        """A section yields its options and leaves the next header unread."""
+
+        sio = StringIO.StringIO("[Switch:sw1]\nnumports = 32\n\n# comment\n"
+                                "fstp=*\n[Switch:sw2]\n")
+        sections = iter(configparser.Parser(sio))
+        self.assertEqual(list(next(sections)),
+                         [("numports", "32"), ("fstp", "*")])
+        self.assertEqual(next(sections).name, "sw2")
+
 
 OLD_CONFIG_FILE = """
 [Project:/home/user/.virtualbricks.vbl]
@@ -15,6 +15,7 @@
 # with this program; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
+import glib
 import gtk
 from twisted.internet import defer
 from twisted.python import filepath
@@ -79,6 +80,65 @@ class TestUsbDevWindow(unittest.TestCase):
         self.assertEquals(self.get_selected_values(),
                           (UsbDevice("1d6b:0001"),) * 5)
 
+    def test_parse_lsusb(self):
+        devices = list(self.dlg.parse_lsusb(OUTPUT.strip()))
+        self.assertEqual(len(devices), 9)
+        self.assertEqual(devices[0].desc,
+                         "Broadcom Corp. Bluetooth Controller")
+        self.assertEqual((devices[1].ID, devices[1].desc), ("4168:1010", ""))
+        self.assertEqual(list(self.dlg.parse_lsusb("no device here")), [])
+
+
+class LazyDialog(dialogs.Window):
+
+    resource = "about.ui"
+    name = "AboutDialog"
+
+
+class BrokenDialog(dialogs.Window):
+
+    resource = "doesnotexists.ui"
+
+
+class TestLazyBuild(GtkTestCase):
+
+    def test_build_on_first_use(self):
+        """The widgets tree is built the first time it is accessed."""
+
+        dialog = LazyDialog()
+        self.assertIs(dialog._builder, None)
+        widget = dialog.widget
+        self.assertIsNot(widget, None)
+        self.assertIs(dialog.widget, widget)
+        self.assertIs(dialog.builder.get_object("AboutDialog"), widget)
+
+    def test_confirm_dialog_lazy(self):
+        """A ConfirmDialog is built only when its window is used."""
+
+        dialog = dialogs.ConfirmDialog("Question?")
+        dialog.format_secondary_text("Details")
+        self.assertIs(dialog._builder, None)
+        self.assertEqual(dialog.window.get_property("text"), "Question?")
+        self.assertEqual(dialog.window.get_property("secondary-text"),
+                         "Details")
+
+    def test_rename_dialog_lazy(self):
+        """A RenameDialog is built only when its window is used."""
+
+        original = Object()
+        original.name = "brick"
+        dialog = dialogs.RenameDialog(original)
+        self.assertIs(dialog._builder, None)
+        self.assertEqual(dialog.get_name(), "brick")
+
+    def test_failed_build(self):
+        """If the build fails, the dialog is not left half built."""
+
+        dialog = BrokenDialog()
+        self.assertRaises(glib.GError, getattr, dialog, "widget")
+        self.assertIs(dialog._builder, None)
+        self.assertRaises(glib.GError, getattr, dialog, "widget")
+
 
 class WindowStub(object):
 
@@ -17,9 +17,62 @@
 
 from twisted.trial import unittest
 
+from virtualbricks.brickfactory import NameIndex
 from virtualbricks.tools import is_running
 from virtualbricks.tests import stubs, successResultOf
-from virtualbricks.errors import BrickRunningError
+from virtualbricks.errors import BrickRunningError, ImageAlreadyInUseError
+
+
+class Sock:
+
+    def __init__(self, nickname):
+        self.nickname = nickname
+
+
+class TreeModelStub:
+    """A one column list model, it records the rows read."""
+
+    def __init__(self):
+        self.rows = []
+        self.read = []
+
+    def __len__(self):
+        return len(self.rows)
+
+    def append(self, obj):
+        self.rows.append(obj)
+
+    # iterators are (row, ) tuples, like gtk.TreeIter they are always true
+
+    def get_iter(self, path):
+        if path >= len(self.rows):
+            raise ValueError("invalid tree path")
+        return (path, )
+
+    def iter_next(self, itr):
+        if itr[0] + 1 < len(self.rows):
+            return (itr[0] + 1, )
+        return None
+
+    def get_value(self, itr, column):
+        self.read.append(itr[0])
+        return self.rows[itr[0]]
+
+
+class TestNameIndex(unittest.TestCase):
+
+    def test_tree_model_read_new_rows_only(self):
+        """The rows of a tree model are read only once."""
+
+        model = TreeModelStub()
+        index = NameIndex(model, "nickname")
+        first, second = Sock("first"), Sock("second")
+        model.append(first)
+        self.assertIs(index.get("first"), first)
+        model.append(second)
+        self.assertIs(index.get("second"), second)
+        self.assertIs(index.get("first"), first)
+        self.assertEqual(model.read, [0, 1])
 
 
 class TestFactory(unittest.TestCase):
@@ -79,3 +132,38 @@ class TestFactory(unittest.TestCase):
         self.assertRaises(BrickRunningError, factory.del_brick, brick)
         self.assertEqual(factory.bricks, [brick])
         self.assertTrue(is_running(brick))
+
+    def test_lookup_during_restore(self):
+        """
+        While restoring, new objects are found by name through the indexes
+        and, after the restore, the lookups see also renamed objects.
+        """
+
+        factory = stubs.Factory()
+        first = factory.new_brick("stub", "first")
+        factory.set_restore(True)
+        self.assertIs(factory.get_brick_by_name("first"), first)
+        switch = factory.new_brick("switch", "sw")
+        event = factory.new_event("ev")
+        self.assertIs(factory.get_brick_by_name("sw"), switch)
+        self.assertIs(factory.get_event_by_name("ev"), event)
+        self.assertIs(factory.get_sock_by_name("sw_port"), switch.socks[0])
+        self.assertTrue(factory.is_in_use("ev"))
+        self.assertFalse(factory.is_in_use("other"))
+        self.assertIs(factory.get_brick_by_name("other"), None)
+        factory.set_restore(False)
+        first.name = "renamed"
+        self.assertIs(factory.get_brick_by_name("renamed"), first)
+        self.assertIs(factory.get_brick_by_name("first"), None)
+
+    def test_image_path_in_use_during_restore(self):
+        """While restoring, a disk image path can be used only once."""
+
+        factory = stubs.Factory()
+        factory.set_restore(True)
+        image = factory.new_disk_image("img", "/vimages/img.qcow2")
+        self.assertIs(factory.get_image_by_path("/vimages/img.qcow2"), image)
+        self.assertRaises(ImageAlreadyInUseError, factory.new_disk_image,
+                          "img2", "/vimages/img.qcow2")
+        factory.set_restore(False)
+        self.assertEqual(factory.disk_images, [image])
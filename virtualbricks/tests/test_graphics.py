@@ -41,3 +41,25 @@ class TestGraphics(unittest.TestCase):
     def test_brick_icon(self):
         self.assertEqual(graphics.brick_icon(self.brick),
                          GUI_PATH + "/data/stub.png")
+
+    def test_pixbuf_for_brick_at_size_cached(self):
+        """Icons are loaded only once for the same size and state."""
+
+        class Pixbuf:
+            def saturate_and_pixelate(self, dest, saturation, pixelate):
+                pass
+
+        loaded = []
+
+        def pixbuf_new_from_file_at_size(filename, width, height):
+            loaded.append((filename, width, height))
+            return Pixbuf()
+
+        self.patch(graphics, "_pixbuf_cache", {})
+        self.patch(graphics.gtk.gdk, "pixbuf_new_from_file_at_size",
+                   pixbuf_new_from_file_at_size)
+        pixbuf = graphics.pixbuf_for_brick_at_size(self.brick, 48, 48)
+        self.assertIs(graphics.pixbuf_for_brick_at_size(self.brick, 48, 48),
+                      pixbuf)
+        graphics.pixbuf_for_brick_at_size(self.brick, 16, 16)
+        self.assertEqual(len(loaded), 2)
@@ -19,7 +19,7 @@ from twisted.trial import unittest
 
 import gtk
 
-from virtualbricks import project, _settings
+from virtualbricks import project, _settings, log
 from virtualbricks.gui import gui, interfaces
 from virtualbricks.tests import stubs
 
@@ -200,6 +200,45 @@ class TestReadme(unittest.TestCase):
         self.assertEqual(prj.get_description(), DESC)
 
 
+class TestTextBufferObserver(unittest.TestCase):
+
+    def setUp(self):
+        self.textbuffer = gtk.TextBuffer()
+        for name, attrs in gui.TEXT_TAGS:
+            self.textbuffer.create_tag(name, **attrs)
+        self.observer = gui.TextBufferObserver(self.textbuffer, max_lines=3)
+
+    def emit(self, msg):
+        self.observer.emit({"log_format": msg, "log_level": log.LogLevel.info,
+                            "log_namespace": "test", "log_time": 0})
+
+    def get_text(self):
+        return self.textbuffer.get_text(self.textbuffer.get_start_iter(),
+                                        self.textbuffer.get_end_iter())
+
+    def test_trim(self):
+        """The oldest lines are dropped when the buffer is full."""
+
+        for i in range(5):
+            self.emit("message %d" % i)
+        self.assertEqual(self.textbuffer.get_line_count(), 3)
+        text = self.get_text()
+        self.assertNotIn("message 2", text)
+        self.assertIn("message 3", text)
+        self.assertTrue(text.endswith("message 4\n"))
+
+    def test_trim_keep_end_mark(self):
+        """After a trim, new messages are still appended at the end."""
+
+        for i in range(5):
+            self.emit("message %d" % i)
+        mark = self.textbuffer.get_mark("end")
+        self.assertTrue(self.textbuffer.get_iter_at_mark(mark).is_end())
+        self.emit("last")
+        self.assertTrue(self.get_text().endswith("last\n"))
+        self.assertIn("message 4", self.get_text())
+
+
 class DumbGui:
 
     def __init__(self, factory):
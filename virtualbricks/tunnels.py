@@ -39,13 +39,12 @@ class TunnelListen(bricks.Brick):
 
     type = "TunnelListen"
     config_factory = TunnelListenConfig
-    command_builder = {"-s": None,
-                       "#password": "password",
-                       "-p": "port"}
 
     def __init__(self, factory, name):
         bricks.Brick.__init__(self, factory, name)
-        self.command_builder["-s"] = self.sock_path
+        self.command_builder = (("#password", "password"),
+                                ("-s", self.sock_path),
+                                ("-p", "port"))
         self.plugs.append(link.Plug(self))
 
     def sock_path(self):
@@ -72,13 +71,8 @@ class TunnelListen(bricks.Brick):
             self.config["password"], self.name)
         exitstatus = os.system(pwdgen)
         logger.info(pwdgen_exit, code=exitstatus)
-        res = []
-        res.append(self.prog())
-        res.append("-P")
-        res.append("/tmp/tunnel_%s.key" % self.name)
-        for arg in self.build_cmd_line():
-            res.append(arg)
-        return res
+        return [self.prog(), "-P", "/tmp/tunnel_%s.key" % self.name] + \
+                self.build_cmd_line()
 
     #def post_poweroff(self):
     #    os.unlink("/tmp/tunnel_%s.key" % self.name)
@@ -95,15 +89,14 @@ class TunnelConnect(TunnelListen):
 
     type = "TunnelConnect"
     config_factory = TunnelConnectConfig
-    command_builder = {"-s": None,
-                       "#password": "password",
-                       "-p": "localport",
-                       "-c": None,
-                       "#port": "port"}
 
     def __init__(self, factory, name):
         TunnelListen.__init__(self, factory, name)
-        self.command_builder["-c"] = self.get_host
+        self.command_builder = (("#port", "port"),
+                                ("-c", self.get_host),
+                                ("#password", "password"),
+                                ("-s", self.sock_path),
+                                ("-p", "localport"))
 
     def get_host(self):
         if self.config["host"]:
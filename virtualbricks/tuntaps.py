@@ -17,7 +17,6 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
 import os
-from collections import OrderedDict as odict
 
 from virtualbricks import bricks, link, settings
 from virtualbricks._spawn import abspath_vde
@@ -43,8 +42,8 @@ class Capture(PrivilegedBrick):
     def __init__(self, factory, name):
         bricks.Brick.__init__(self, factory, name)
         self.plugs.append(link.Plug(self))
-        self.command_builder = odict((("-s", self.sock_path),
-                                      ("*iface", "iface")))
+        self.command_builder = (("-s", self.sock_path),
+                                ("*iface", "iface"))
 
     def sock_path(self):
         if self.plugs[0].sock:
@@ -85,8 +84,8 @@ class Tap(PrivilegedBrick):
     def __init__(self, factory, name):
         bricks.Brick.__init__(self, factory, name)
         self.plugs.append(link.Plug(self))
-        self.command_builder["-s"] = self.sock_path
-        self.command_builder["*tap"] = self.get_name
+        self.command_builder = (("-s", self.sock_path),
+                                ("*tap", self.get_name))
 
     def sock_path(self):
         if self.plugs[0].sock:
@@ -18,7 +18,6 @@
 
 import os
 import errno
-import re
 import datetime
 import shutil
 import itertools
@@ -396,51 +395,51 @@ class Disk:
                     self=self, readonly=self.readonly())
 
 
-VM_COMMAND_BUILDER = {
-        "#argv0": "argv0",
-        "#M": "machine",
-        "#cpu": "cpu",
-        "-smp": "smp",
-        "-m": "ram",
-        "-boot": "boot",
+VM_COMMAND_BUILDER = (
+        ("#argv0", "argv0"),
+        ("#M", "machine"),
+        ("#cpu", "cpu"),
+        ("-m", "ram"),
+        ("-smp", "smp"),
+        ("-boot", "boot"),
         # numa not supported
-        "#privatehda": "privatehda",
-        "#privatehdb": "privatehdb",
-        "#privatehdc": "privatehdc",
-        "#privatehdd": "privatehdd",
-        "#privatefda": "privatefda",
-        "#privatefdb": "privatefdb",
-        "#privatemtdblock": "privatemtdblock",
-        "#cdrom": "cdrom",
-        "#device": "device",
-        "#cdromen": "cdromen",
-        "#deviceen": "deviceen",
-        "#keyboard": "keyboard",
-        "#usbdevlist": "usbdevlist",
-        "-soundhw": "soundhw",
-        "-usb": "usbmode",
+        ("#privatehda", "privatehda"),
+        ("#privatehdb", "privatehdb"),
+        ("#privatehdc", "privatehdc"),
+        ("#privatehdd", "privatehdd"),
+        ("#privatefda", "privatefda"),
+        ("#privatefdb", "privatefdb"),
+        ("#privatemtdblock", "privatemtdblock"),
+        ("#cdrom", "cdrom"),
+        ("#device", "device"),
+        ("#cdromen", "cdromen"),
+        ("#deviceen", "deviceen"),
+        ("#keyboard", "keyboard"),
+        ("#usbdevlist", "usbdevlist"),
+        ("-soundhw", "soundhw"),
+        ("-usb", "usbmode"),
         # "-uuid": "uuid",
         # "-curses": "curses", ## not implemented
         # "-no-frame": "noframe", ## not implemented
         # "-no-quit": "noquit", ## not implemented.
-        "-snapshot": "snapshot",
-        "#vga": "vga",
-        "#vncN": "vncN",
-        "#vnc": "vnc",
+        ("-snapshot", "snapshot"),
+        ("#vga", "vga"),
+        ("#vncN", "vncN"),
+        ("#vnc", "vnc"),
         # "-full-screen": "full-screen", ## TODO 0.3
-        "-sdl": "sdl",
-        "-portrait": "portrait",
-        "-win2k-hack": "win2k",  # not implemented
-        "-no-acpi": "noacpi",
+        ("-sdl", "sdl"),
+        ("-portrait", "portrait"),
+        ("-win2k-hack", "win2k"),  # not implemented
+        ("-no-acpi", "noacpi"),
         # "-no-hpet": "nohpet", ## ???
         # "-baloon": "baloon", ## ???
         # #acpitable not supported
         # #smbios not supported
-        "#kernel": "kernel",
-        "#kernelenbl": "kernelenbl",
-        "#append": "kopt",
-        "#initrd": "initrd",
-        "#initrdenbl": "initrdenbl",
+        ("#kernel", "kernel"),
+        ("#kernelenbl", "kernelenbl"),
+        ("#append", "kopt"),
+        ("#initrd", "initrd"),
+        ("#initrdenbl", "initrdenbl"),
         # "-serial": "serial",
         # "-parallel": "parallel",
         # "-monitor": "monitor",
@@ -449,21 +448,21 @@ VM_COMMAND_BUILDER = {
         # "-pidfile": "", ## not needed
         # "-singlestep": "",
         # "-S": "",
-        "#gdb_e": "gdb",
-        "#gdb_port": "gdbport",
+        ("#gdb_e", "gdb"),
+        ("#gdb_port", "gdbport"),
         # "-s": "",
         # "-d": "",
         # "-hdachs": "",
         # "-L": "",
         # "-bios": "",
-        "#kvm": "kvm",
+        ("#kvm", "kvm"),
         # "-no-reboot": "", ## not supported
         # "-no-shutdown": "", ## not supported
-        "-loadvm": "loadvm",
+        ("-loadvm", "loadvm"),
         # "-daemonize": "", ## not supported
         # "-option-rom": "",
         # "-clock": "",
-        "#rtc": "rtc",
+        ("#rtc", "rtc"),
         # "-icount": "",
         # "-watchdog": "",
         # "-watchdog-action": "",
@@ -484,13 +483,13 @@ VM_COMMAND_BUILDER = {
         # "-pcidevice": "",
         # "-enable-nesting": "",
         # "-nvram": "",
-        "#kvmsm": "kvmsm",
-        "#kvmsmem": "kvmsmem",
+        ("#kvmsm", "kvmsm"),
+        ("#kvmsmem", "kvmsmem"),
         # "-mem-path": "",
         # "-mem-prealloc": "",
-        "#icon": "icon",
-        "#serial": "serial",
-        "#stdout": ""}
+        ("#icon", "icon"),
+        ("#serial", "serial"),
+        ("#stdout", ""))
 
 
 class DefaultDevice:
@@ -711,49 +710,51 @@ class VirtualMachine(bricks.Brick):
         return d
 
     def __args(self, results):
+        config = self.config
+        name = self.name
         res = [self.prog()]
-        if (self.config['kvm'] or self.config['machine'] or
-                self.config['kvmsm']):
+        if (config['kvm'] or config['machine'] or
+                config['kvmsm']):
             props = []
-            if self.config["machine"]:
-                props.append('type={}'.format(self.config["machine"]))
-            if self.config['kvm']:
+            if config["machine"]:
+                props.append('type={}'.format(config["machine"]))
+            if config['kvm']:
                 props.append('accel=kvm:tcg')
-            if self.config["kvmsm"]:
+            if config["kvmsm"]:
                 props.append(
-                    'kvm_shadow_mem={}'.format(self.config["kvmsmem"])
+                    'kvm_shadow_mem={}'.format(config["kvmsmem"])
                 )
             res.extend(['-machine', ','.join(props)])
 
-        if self.config["cpu"]:
-            res.extend(["-cpu", self.config["cpu"]])
-        res.extend(list(self.build_cmd_line()))
-        if self.config["novga"]:
+        if config["cpu"]:
+            res.extend(["-cpu", config["cpu"]])
+        res.extend(self.build_cmd_line())
+        if config["novga"]:
             res.extend(["-display", "none"])
         for disk_args in results:
             res.extend(disk_args)
-        if self.config["kernelenbl"] and self.config["kernel"]:
-            res.extend(["-kernel", self.config["kernel"]])
-        if self.config["initrdenbl"] and self.config["initrd"]:
-            res.extend(["-initrd", self.config["initrd"]])
-        if (self.config["kopt"] and self.config["kernelenbl"] and
-                self.config["kernel"]):
+        if config["kernelenbl"] and config["kernel"]:
+            res.extend(["-kernel", config["kernel"]])
+        if config["initrdenbl"] and config["initrd"]:
+            res.extend(["-initrd", config["initrd"]])
+        if (config["kopt"] and config["kernelenbl"] and
+                config["kernel"]):
             res.extend([
                 "-append",
-                "'{0}'".format(re.sub("\"", "", self.config["kopt"]))
+                "'{0}'".format(config["kopt"].replace('"', ''))
             ])
-        if self.config["gdb"]:
-            res.extend(["-gdb", "tcp::%d" % self.config["gdbport"]])
-        if self.config["vnc"]:
-            res.extend(["-vnc", ":%d" % self.config["vncN"]])
-        if self.config["vga"]:
+        if config["gdb"]:
+            res.extend(["-gdb", "tcp::%d" % config["gdbport"]])
+        if config["vnc"]:
+            res.extend(["-vnc", ":%d" % config["vncN"]])
+        if config["vga"]:
             res.extend(["-vga", "std"])
 
-        if self.config["usbmode"]:
-            for dev in self.config["usbdevlist"]:
+        if config["usbmode"]:
+            for dev in config["usbdevlist"]:
                 res.extend(["-usbdevice", "host:%s" % dev])
 
-        res.extend(["-name", self.name])
+        res.extend(["-name", name])
         if not self.plugs and not self.socks:
             res.extend(["-net", "none"])
         else:
@@ -774,22 +775,22 @@ class VirtualMachine(bricks.Brick):
                 else:
                     res.extend(["-net", "user"])
 
-        if self.config["cdromen"] and self.config["cdrom"]:
-                res.extend(["-cdrom", self.config["cdrom"]])
-        elif self.config["deviceen"] and self.config["device"]:
-                res.extend(["-cdrom", self.config["device"]])
-        if (self.config["rtc"] or self.config["tdf"]):
+        if config["cdromen"] and config["cdrom"]:
+                res.extend(["-cdrom", config["cdrom"]])
+        elif config["deviceen"] and config["device"]:
+                res.extend(["-cdrom", config["device"]])
+        if (config["rtc"] or config["tdf"]):
             rtcarg = []
-            if self.config['rtc']:
+            if config['rtc']:
                 rtcarg.append('base=localtime')
-            if self.config['tdf']:
+            if config['tdf']:
                 rtcarg.append('driftfix=slew')
             res.extend(['-rtc', ','.join(rtcarg)])
-        if len(self.config["keyboard"]) == 2:
-            res.extend(["-k", self.config["keyboard"]])
-        if self.config["serial"]:
+        if len(config["keyboard"]) == 2:
+            res.extend(["-k", config["keyboard"]])
+        if config["serial"]:
             res.extend(["-serial", "unix:%s/%s_serial,server,nowait" %
-                        (settings.VIRTUALBRICKS_HOME, self.name)])
+                        (settings.VIRTUALBRICKS_HOME, name)])
         res.extend(["-mon", "chardev=mon", "-chardev",
                     "socket,id=mon,path=%s,server,nowait" %
                     self.console(),
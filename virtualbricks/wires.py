@@ -55,7 +55,7 @@ class Wire(bricks.Brick):
         return len(self.plugs) == 2 and all(map(lambda p: p.sock, self.plugs))
 
     def prog(self):
-        return abspath_vde('dpipe'),
+        return abspath_vde('dpipe')
 
     def args(self):
         return [self.prog(),
@@ -99,10 +99,10 @@ class Netemu(Wire):
 
     def __init__(self, factory, name):
         Wire.__init__(self, factory, name)
-        self.command_builder = {
-            "--nofifo": lambda: "*",
-            "-M": self.console,
-        }
+        self.command_builder = (
+            ("-M", self.console),
+            ("--nofifo", lambda: "*"),
+        )
 
     def args(self):
         res = [self.prog(), "-v", self.plugs[0].sock.path.rstrip('[]') + ":" +